@@ -1,4 +1,3 @@
-import re
 import secrets
 import string
 
@@ -15,11 +14,14 @@ Parameters:
 Returns:
 - str: A randomly generated password that meets the specified constraints.
 
+Raises:
+- ValueError: If the sum of the minimum requirements exceeds the password length.
+
 Algorithm:
 1. Define the pool of possible characters (letters, digits, and symbols).
-2. Generate a password by randomly selecting characters from the pool.
-3. Validate the password against the specified constraints using regex.
-4. Repeat the process until a valid password is generated.
+2. Randomly select the minimum number of characters required from each class.
+3. Fill the remaining length by randomly selecting characters from the full pool.
+4. Shuffle the selected characters to produce the password.
 
 Example:
     new_password = generate_password(length=12, nums=2, special_chars=2, uppercase=2, lowercase=2)
@@ -37,26 +39,29 @@ def generate_password(length=16, nums=1, special_chars=1, uppercase=1, lowercase
     # Combine all characters
     all_characters = letters + digits + symbols
 
-    while True:
-        password = ""
-        # Generate password
-        for _ in range(length):
-            password += secrets.choice(all_characters)
-
-        constraints = [
-            (nums, r"\d"),
-            (special_chars, rf"[{symbols}]"),
-            (uppercase, r"[A-Z]"),
-            (lowercase, r"[a-z]"),
-        ]
-
-        # Check constraints
-        if all(
-            constraint <= len(re.findall(pattern, password))
-            for constraint, pattern in constraints
-        ):
-            break
+    required = nums + special_chars + uppercase + lowercase
+    if required > length:
+        raise ValueError(
+            f"Password length {length} is too short for {required} required characters"
+        )
+
+    rng = secrets.SystemRandom()
+
+    # Draw the required characters of each class
+    chars = (
+        rng.choices(digits, k=nums)
+        + rng.choices(symbols, k=special_chars)
+        + rng.choices(string.ascii_uppercase, k=uppercase)
+        + rng.choices(string.ascii_lowercase, k=lowercase)
+    )
+
+    # Fill the remaining positions from the full pool
+    chars += rng.choices(all_characters, k=length - required)
+
+    # Shuffle so the required characters are not grouped at the start
+    rng.shuffle(chars)
 
+    password = "".join(chars)
     return password
 
 
@@ -8,13 +8,13 @@ Parameters:
 
 Returns:
 - distances (dict): A dictionary with the shortest distance from the start node to each node.
-- paths (dict): A dictionary with the shortest path from the start node to each node.
+- paths (dict): A dictionary with the shortest path from the start node to the target node (or to each node if no target is given).
 
 Algorithm:
 1. Initialize distances to all nodes as infinity, except the start node (distance 0).
-2. Use a priority queue (implicitly via `min`) to visit the node with the smallest distance.
-3. Update distances and paths for neighboring nodes if a shorter path is found.
-4. Repeat until all nodes are visited.
+2. Use a binary-heap priority queue to visit the node with the smallest distance, skipping stale entries.
+3. Update distances and predecessors for neighboring nodes if a shorter path is found.
+4. Repeat until the queue is empty, then rebuild the requested paths by walking the predecessors backwards.
 
 Example:
     my_graph = {
@@ -31,32 +31,47 @@ Example:
     # Path: A -> C -> B -> F
 """
 
+import heapq
+import sys
+
+
+def _reconstruct(predecessor, target):
+    if target not in predecessor:
+        return []
+    path = []
+    current = target
+    while current is not None:
+        path.append(current)
+        current = predecessor[current]
+    return path[::-1]
+
 
 def shortest_path(graph, start, target=""):
-    unvisited = list(graph)
     distances = {node: 0 if node == start else float("inf") for node in graph}
-    paths = {node: [] for node in graph}
-    paths[start].append(start)
-
-    while unvisited:
-        current = min(unvisited, key=distances.get)
-        for node, distance in graph[current]:
-            if distance + distances[current] < distances[node]:
-                distances[node] = distance + distances[current]
-                if paths[node] and paths[node][-1] == node:
-                    paths[node] = paths[current][:]
-                else:
-                    paths[node].extend(paths[current])
-                paths[node].append(node)
-        unvisited.remove(current)
+    predecessor = {start: None}
+    queue = [(0, start)]
+
+    while queue:
+        distance, current = heapq.heappop(queue)
+        if distance > distances[current]:
+            continue
+        for node, weight in graph[current]:
+            if distance + weight < distances[node]:
+                distances[node] = distance + weight
+                predecessor[node] = current
+                heapq.heappush(queue, (distances[node], node))
 
     targets_to_print = [target] if target else graph
+    paths = {}
+    lines = []
     for node in targets_to_print:
+        paths[node] = _reconstruct(predecessor, node)
         if node == start:
             continue
-        print(
-            f'\n{start}-{node} distance: {distances[node]}\nPath: {" -> ".join(paths[node])}'
+        lines.append(
+            f'\n{start}-{node} distance: {distances[node]}\nPath: {" -> ".join(paths[node])}\n'
         )
+    sys.stdout.write("".join(lines))
 
     return distances, paths
 
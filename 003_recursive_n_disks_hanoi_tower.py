@@ -1,45 +1,57 @@
 """
-Solves the Tower of Hanoi problem recursively.
+Solves the Tower of Hanoi problem iteratively.
 
 Parameters:
 - n (int): The number of disks to move.
 - source (list): The source peg (where the disks start).
 - auxiliary (list): The auxiliary peg (used for temporary storage).
 - target (list): The target peg (where the disks should end up).
+- log (list, optional): If given, each move is appended to it as a (from_peg, to_peg) tuple,
+  where 0, 1 and 2 stand for the source, auxiliary and target pegs.
 
 Returns:
-- None: The function modifies the pegs in place and prints the progress.
+- None: The function modifies the pegs in place and records the progress in `log`.
 
 Algorithm:
-1. Move n - 1 disks from the source peg to the auxiliary peg.
-2. Move the nth disk from the source peg to the target peg.
-3. Move the n - 1 disks from the auxiliary peg to the target peg.
+1. Number the 2^n - 1 moves of the optimal solution k = 1, 2, ..., 2^n - 1.
+2. Order the pegs (source, auxiliary, target) for odd n, or
+   (source, target, auxiliary) for even n.
+3. Move k takes the top disk of peg (k & (k - 1)) % 3 to peg ((k | (k - 1)) + 1) % 3.
 
 Example:
     NUMBER_OF_DISKS = 3
     A = [3, 2, 1]  # Source peg
     B = []         # Auxiliary peg
     C = []         # Target peg
-    move(NUMBER_OF_DISKS, A, B, C)
-    # Displays the step-by-step movement of disks from A to C.
+    log = []
+    move(NUMBER_OF_DISKS, A, B, C, log)
+    # log holds the step-by-step movement of disks from A to C: [(0, 2), (0, 1), (2, 1), ...]
 """
 
+import sys
 
-def move(n, source, auxiliary, target):
+
+def move(n, source, auxiliary, target, log=None):
     if n <= 0:
         return
 
-    # move n - 1 disks from source to auxiliary, so they are out of the way
-    move(n - 1, source, target, auxiliary)
-
-    # move the nth disk from source to target
-    target.append(source.pop())
+    # order the pegs by the parity of n so that the tower ends up on target
+    if n % 2:
+        order = (0, 1, 2)
+    else:
+        order = (0, 2, 1)
+    all_pegs = (source, auxiliary, target)
+    pegs = tuple(all_pegs[i] for i in order)
 
-    # display our progress
-    print(A, B, C, "\n")
+    for k in range(1, 1 << n):
+        # move number k goes from peg (k & (k - 1)) to peg ((k | (k - 1)) + 1), modulo 3
+        from_peg = (k & (k - 1)) % 3
+        to_peg = ((k | (k - 1)) + 1) % 3
+        pegs[to_peg].append(pegs[from_peg].pop())
 
-    # move the n - 1 disks that we left on auxiliary onto target
-    move(n - 1, auxiliary, source, target)
+        # record our progress
+        if log is not None:
+            log.append((order[from_peg], order[to_peg]))
 
 
 NUMBER_OF_DISKS = 7
@@ -48,4 +60,11 @@ B = []
 C = []
 
 # initiate call from source A to target C with auxiliary B
-move(NUMBER_OF_DISKS, A, B, C)
+moves = []
+move(NUMBER_OF_DISKS, A, B, C, moves)
+
+# display our progress with a single write
+PEG_NAMES = "ABC"
+sys.stdout.write(
+    "\n".join(f"{PEG_NAMES[s]} -> {PEG_NAMES[d]}" for s, d in moves) + "\n"
+)
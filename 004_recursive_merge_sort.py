@@ -8,9 +8,17 @@ Returns:
 - None: The array is sorted in place, so no value is returned.
 
 Algorithm:
-1. Divide the array into two halves.
-2. Recursively sort each half.
-3. Merge the two sorted halves back together in ascending order.
+1. Treat every element as a sorted run of width 1.
+2. Merge adjacent runs pairwise into a single scratch buffer, doubling the run width.
+3. Swap the roles of the array and the scratch buffer and repeat until one run remains.
+4. Copy the result back into the array if the last pass ended in the scratch buffer.
+
+Numeric NumPy arrays are sorted by a Numba-compiled version of the same loop
+when `numpy` and `numba` are installed; lists always use the pure-Python path.
+
+For large inputs, `parallel_merge_sort` splits the array into one chunk per
+worker process, sorts the chunks concurrently and k-way merges the results.
+Arrays shorter than `PARALLEL_THRESHOLD` are sorted in the current process.
 
 Example:
     numbers = [4, 10, 6, 14, 2, 1, 8, 5]
@@ -18,42 +26,134 @@ Example:
     # numbers will be [1, 2, 4, 5, 6, 8, 10, 14]
 """
 
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
 
-def merge_sort(array):
-    if len(array) <= 1:
-        return
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
 
-    middle_point = len(array) // 2
-    left_part = array[:middle_point]
-    right_part = array[middle_point:]
+PARALLEL_THRESHOLD = 100_000
 
-    merge_sort(left_part)
-    merge_sort(right_part)
 
-    left_array_index = 0
-    right_array_index = 0
-    sorted_index = 0
+def _merge(source, destination, start, middle, end):
+    left_array_index = start
+    right_array_index = middle
+    sorted_index = start
 
-    while left_array_index < len(left_part) and right_array_index < len(right_part):
-        if left_part[left_array_index] < right_part[right_array_index]:
-            array[sorted_index] = left_part[left_array_index]
+    while left_array_index < middle and right_array_index < end:
+        if source[left_array_index] <= source[right_array_index]:
+            destination[sorted_index] = source[left_array_index]
             left_array_index += 1
         else:
-            array[sorted_index] = right_part[right_array_index]
+            destination[sorted_index] = source[right_array_index]
             right_array_index += 1
         sorted_index += 1
 
-    while left_array_index < len(left_part):
-        array[sorted_index] = left_part[left_array_index]
+    while left_array_index < middle:
+        destination[sorted_index] = source[left_array_index]
         left_array_index += 1
         sorted_index += 1
 
-    while right_array_index < len(right_part):
-        array[sorted_index] = right_part[right_array_index]
+    while right_array_index < end:
+        destination[sorted_index] = source[right_array_index]
         right_array_index += 1
         sorted_index += 1
 
 
+if njit is not None:
+
+    @njit(cache=True)
+    def _merge_sort_numeric(array, scratch):
+        length = array.shape[0]
+        source, destination = array, scratch
+        in_scratch = False
+
+        width = 1
+        while width < length:
+            for start in range(0, length, 2 * width):
+                middle = min(start + width, length)
+                end = min(start + 2 * width, length)
+                left_array_index = start
+                right_array_index = middle
+                sorted_index = start
+                while left_array_index < middle and right_array_index < end:
+                    if source[left_array_index] <= source[right_array_index]:
+                        destination[sorted_index] = source[left_array_index]
+                        left_array_index += 1
+                    else:
+                        destination[sorted_index] = source[right_array_index]
+                        right_array_index += 1
+                    sorted_index += 1
+                while left_array_index < middle:
+                    destination[sorted_index] = source[left_array_index]
+                    left_array_index += 1
+                    sorted_index += 1
+                while right_array_index < end:
+                    destination[sorted_index] = source[right_array_index]
+                    right_array_index += 1
+                    sorted_index += 1
+            source, destination = destination, source
+            in_scratch = not in_scratch
+            width *= 2
+
+        if in_scratch:
+            array[:] = scratch
+
+
+def merge_sort(array):
+    if (
+        njit is not None
+        and isinstance(array, np.ndarray)
+        and array.ndim == 1
+        and array.dtype.kind in "iuf"
+    ):
+        _merge_sort_numeric(array, np.empty_like(array))
+        return
+
+    length = len(array)
+    scratch = [None] * length
+    source, destination = array, scratch
+
+    width = 1
+    while width < length:
+        for start in range(0, length, 2 * width):
+            middle = min(start + width, length)
+            end = min(start + 2 * width, length)
+            _merge(source, destination, start, middle, end)
+        source, destination = destination, source
+        width *= 2
+
+    if source is not array:
+        # copy back one item at a time so any mutable sequence type accepts it
+        for index, value in enumerate(source):
+            array[index] = value
+
+
+def _sort_chunk(chunk):
+    merge_sort(chunk)
+    return chunk
+
+
+def parallel_merge_sort(array, workers=None):
+    workers = workers or os.cpu_count() or 1
+    length = len(array)
+    if workers == 1 or length < PARALLEL_THRESHOLD:
+        merge_sort(array)
+        return
+
+    chunk_size = -(-length // workers)
+    chunks = [array[i : i + chunk_size] for i in range(0, length, chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        sorted_chunks = list(executor.map(_sort_chunk, chunks))
+
+    array[:] = list(heapq.merge(*sorted_chunks))
+
+
 if __name__ == "__main__":
     numbers = [4, 10, 6, 14, 2, 1, 8, 5, 200, 2, 2, 11, 12, 13, 1, 1, 9, 0]
     print(f"Unsorted array: {numbers}")
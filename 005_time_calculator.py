@@ -15,6 +15,17 @@ Example:
     # Returns: '6:18 AM, Monday (20 days later)'
 """
 
+DAYS_OF_WEEK = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+DAY_INDEX = {day.lower(): index for index, day in enumerate(DAYS_OF_WEEK)}
+
 
 def add_time(start_time, duration, start_day=None):
     # Split the start time into components
@@ -46,18 +57,8 @@ def add_time(start_time, duration, start_day=None):
 
     # Handle day of the week if provided
     if start_day:
-        days_of_week = [
-            "Monday",
-            "Tuesday",
-            "Wednesday",
-            "Thursday",
-            "Friday",
-            "Saturday",
-            "Sunday",
-        ]
-        start_day_index = days_of_week.index(start_day.lower().capitalize())
-        new_day_index = (start_day_index + days_passed) % 7
-        new_day = days_of_week[new_day_index]
+        start_day_index = DAY_INDEX[start_day.lower()]
+        new_day = DAYS_OF_WEEK[(start_day_index + days_passed) % 7]
         new_time += f", {new_day}"
 
     # Add days later information
@@ -5,14 +5,14 @@ Classes:
     Board: Represents the Sudoku board and contains methods for validating and solving the puzzle.
 
 Methods of the Board class:
-    __init__(self, board): Initializes the board with a 9x9 matrix.
+    __init__(self, board): Flattens a 9x9 matrix into an 81-cell array and initializes the row, column and square bitmasks of used digits.
     __str__(self): Returns a visual representation of the board, where empty cells are marked with '*'.
-    find_empty_cell(self): Finds the next empty cell (value 0) on the board.
+    find_empty_cell(self): Finds the empty cell (value 0) with the fewest valid numbers left on the board.
     valid_in_row(self, row, num): Checks if a number is valid in a specific row.
     valid_in_col(self, col, num): Checks if a number is valid in a specific column.
     valid_in_square(self, row, col, num): Checks if a number is valid in the 3x3 square containing the cell (row, col).
     is_valid(self, empty, num): Checks if a number is valid in a specific cell, considering row, column, and square.
-    solver(self): Solves the Sudoku puzzle using backtracking. Returns True if the puzzle is solvable, False otherwise.
+    solver(self): Solves the Sudoku puzzle using iterative backtracking. Returns True if the puzzle is solvable, False otherwise.
 
 Functions:
     solve_sudoku(board): Takes a Sudoku board (9x9 matrix) and attempts to solve it. Prints the original puzzle and the solution if found.
@@ -32,61 +32,128 @@ Usage Example:
     solve_sudoku(puzzle)
 """
 
+import array
+
+# index of the 3x3 square containing each cell, precomputed to avoid divisions
+SQUARE_INDEX = tuple((cell // 27) * 3 + (cell % 9) // 3 for cell in range(81))
+
 
 class Board:
     def __init__(self, board):
-        self.board = board
+        # flat row-major board: cell (row, col) is stored at index row * 9 + col
+        self.board = array.array("b", [num for row in board for num in row])
+        # bit n of each mask is set when the number n is already used
+        self.row_mask = [0] * 9
+        self.col_mask = [0] * 9
+        self.square_mask = [0] * 9
+        for cell, num in enumerate(self.board):
+            if num:
+                bit = 1 << num
+                self.row_mask[cell // 9] |= bit
+                self.col_mask[cell % 9] |= bit
+                self.square_mask[SQUARE_INDEX[cell]] |= bit
 
     def __str__(self):
         board_str = ""
-        for row in self.board:
-            row_str = [str(i) if i else "*" for i in row]
+        for row in range(9):
+            row_str = [str(i) if i else "*" for i in self.board[row * 9 : row * 9 + 9]]
             board_str += " ".join(row_str)
             board_str += "\n"
         return board_str
 
     def find_empty_cell(self):
-        for row, contents in enumerate(self.board):
+        board = self.board
+        if 0 not in board:
+            return None
+        best_cell = None
+        best_candidates = 10
+        cell = board.index(0)
+        while True:
+            row, col = divmod(cell, 9)
+            used = (
+                self.row_mask[row]
+                | self.col_mask[col]
+                | self.square_mask[SQUARE_INDEX[cell]]
+            )
+            candidates = 9 - used.bit_count()
+            if candidates < best_candidates:
+                best_cell = row, col
+                best_candidates = candidates
+                # a cell with one or no candidates cannot be beaten
+                if candidates <= 1:
+                    return best_cell
             try:
-                col = contents.index(0)
-                return row, col
+                cell = board.index(0, cell + 1)
             except ValueError:
-                pass
-        return None
+                return best_cell
 
     def valid_in_row(self, row, num):
-        return num not in self.board[row]
+        return num not in self.board[row * 9 : row * 9 + 9]
 
     def valid_in_col(self, col, num):
-        return all(self.board[row][col] != num for row in range(9))
+        return num not in self.board[col::9]
 
     def valid_in_square(self, row, col, num):
         row_start = (row // 3) * 3
         col_start = (col // 3) * 3
         for row_no in range(row_start, row_start + 3):
-            for col_no in range(col_start, col_start + 3):
-                if self.board[row_no][col_no] == num:
-                    return False
+            start = row_no * 9 + col_start
+            if num in self.board[start : start + 3]:
+                return False
         return True
 
     def is_valid(self, empty, num):
         row, col = empty
-        valid_in_row = self.valid_in_row(row, num)
-        valid_in_col = self.valid_in_col(col, num)
-        valid_in_square = self.valid_in_square(row, col, num)
-        return all([valid_in_row, valid_in_col, valid_in_square])
+        used = (
+            self.row_mask[row]
+            | self.col_mask[col]
+            | self.square_mask[SQUARE_INDEX[row * 9 + col]]
+        )
+        return not used >> num & 1
 
     def solver(self):
-        if (next_empty := self.find_empty_cell()) is None:
-            return True
-        for guess in range(1, 10):
-            if self.is_valid(next_empty, guess):
+        # bind the board and masks to locals so the hot loop avoids attribute lookups
+        board = self.board
+        row_mask = self.row_mask
+        col_mask = self.col_mask
+        square_mask = self.square_mask
+        square_index = SQUARE_INDEX
+        find_empty_cell = self.find_empty_cell
+
+        # stack of the cells filled so far and the guess placed in each of them
+        guesses = []
+        next_empty = find_empty_cell()
+        guess = 1
+        while next_empty is not None:
+            row, col = next_empty
+            cell = row * 9 + col
+            square = square_index[cell]
+            used = row_mask[row] | col_mask[col] | square_mask[square]
+            while guess < 10 and used >> guess & 1:
+                guess += 1
+            if guess < 10:
+                bit = 1 << guess
+                board[cell] = guess
+                row_mask[row] |= bit
+                col_mask[col] |= bit
+                square_mask[square] |= bit
+                guesses.append((next_empty, guess))
+                next_empty = find_empty_cell()
+                guess = 1
+            elif guesses:
+                # no number fits this cell: undo the previous guess and try the next one
+                next_empty, guess = guesses.pop()
                 row, col = next_empty
-                self.board[row][col] = guess
-                if self.solver():
-                    return True
-                self.board[row][col] = 0
-        return False
+                cell = row * 9 + col
+                bit = ~(1 << guess)
+                board[cell] = 0
+                row_mask[row] &= bit
+                col_mask[col] &= bit
+                square_mask[square_index[cell]] &= bit
+                guess += 1
+            else:
+                return False
+        return True
 
 
 def solve_sudoku(board):
@@ -11,14 +11,13 @@ Methods of the TreeNode class:
 
 Methods of the BinarySearchTree class:
     __init__(self) -> None: Initializes an empty BST.
-    _insert(self, node: Optional[TreeNode], key: int) -> TreeNode: Helper method to recursively insert a key into the BST.
+    _insert(self, node: Optional[TreeNode], key: int) -> TreeNode: Helper method to iteratively insert a key into the BST.
     insert(self, key: int) -> None: Inserts a key into the BST.
-    _search(self, node: Optional[TreeNode], key: int) -> Optional[TreeNode]: Helper method to recursively search for a key in the BST.
+    _search(self, node: Optional[TreeNode], key: int) -> Optional[TreeNode]: Helper method to iteratively search for a key in the BST.
     search(self, key: int) -> Optional[TreeNode]: Searches for a key in the BST.
-    _delete(self, node: Optional[TreeNode], key: int) -> Optional[TreeNode]: Helper method to recursively delete a key from the BST.
+    _delete(self, node: Optional[TreeNode], key: int) -> Optional[TreeNode]: Helper method to iteratively delete a key from the BST.
     delete(self, key: int) -> None: Deletes a key from the BST.
-    _min_value(self, node: TreeNode) -> int: Helper method to find the smallest key in a subtree.
-    _inorder_traversal(self, node: Optional[TreeNode], result: List[int]) -> None: Helper method to perform an inorder traversal of the BST.
+    _inorder_traversal(self, node: Optional[TreeNode], result: List[int]) -> None: Helper method to perform an iterative inorder traversal of the BST.
     inorder_traversal(self) -> List[int]: Performs an inorder traversal of the BST and returns the keys in ascending order.
 
 Usage Example:
@@ -45,6 +44,8 @@ class TreeNode:
         right: Reference to the right child node.
     """
 
+    __slots__ = ("key", "left", "right")
+
     def __init__(self, key: int) -> None:
         """
         Initializes a TreeNode with a given key.
@@ -82,23 +83,33 @@ class BinarySearchTree:
 
     def _insert(self, node: Optional[TreeNode], key: int) -> TreeNode:
         """
-        Helper method to recursively insert a key into the BST.
+        Helper method to iteratively insert a key into the BST.
 
         Args:
-            node: The current node being processed.
+            node: The root node of the subtree.
             key: The value to be inserted.
 
         Returns:
-            The node with the key inserted.
+            The root node of the subtree with the key inserted.
         """
         if node is None:
-            return TreeNode(key)  # Create a new node if the current node is None
-
-        # Recursively insert into the left or right subtree
-        if key < node.key:
-            node.left = self._insert(node.left, key)
-        elif key > node.key:
-            node.right = self._insert(node.right, key)
+            return TreeNode(key)  # Create a new node if the subtree is empty
+
+        # Walk down the left or right subtree until a free slot is found
+        current = node
+        while True:
+            if key < current.key:
+                if current.left is None:
+                    current.left = TreeNode(key)
+                    break
+                current = current.left
+            elif key > current.key:
+                if current.right is None:
+                    current.right = TreeNode(key)
+                    break
+                current = current.right
+            else:
+                break  # Key already present
         return node
 
     def insert(self, key: int) -> None:
@@ -112,22 +123,19 @@ class BinarySearchTree:
 
     def _search(self, node: Optional[TreeNode], key: int) -> Optional[TreeNode]:
         """
-        Helper method to recursively search for a key in the BST.
+        Helper method to iteratively search for a key in the BST.
 
         Args:
-            node: The current node being processed.
+            node: The root node of the subtree.
             key: The value to search for.
 
         Returns:
             The node containing the key, or None if the key is not found.
         """
-        if node is None or node.key == key:
-            return node  # Return the node if found or None if not found
-
-        # Recursively search in the left or right subtree
-        if key < node.key:
-            return self._search(node.left, key)
-        return self._search(node.right, key)
+        # Walk down the left or right subtree until the key or a leaf is reached
+        while node is not None and node.key != key:
+            node = node.left if key < node.key else node.right
+        return node  # Return the node if found or None if not found
 
     def search(self, key: int) -> Optional[TreeNode]:
         """
@@ -143,35 +151,44 @@ class BinarySearchTree:
 
     def _delete(self, node: Optional[TreeNode], key: int) -> Optional[TreeNode]:
         """
-        Helper method to recursively delete a key from the BST.
+        Helper method to iteratively delete a key from the BST.
 
         Args:
-            node: The current node being processed.
+            node: The root node of the subtree.
             key: The value to be deleted.
 
         Returns:
-            The node with the key deleted.
+            The root node of the subtree with the key deleted.
         """
-        if node is None:
-            return node  # Return None if the node is not found
-
-        # Recursively delete from the left or right subtree
-        if key < node.key:
-            node.left = self._delete(node.left, key)
-        elif key > node.key:
-            node.right = self._delete(node.right, key)
+        # Find the node to delete and its parent
+        parent = None
+        current = node
+        while current is not None and current.key != key:
+            parent = current
+            current = current.left if key < current.key else current.right
+
+        if current is None:
+            return node  # Return the subtree unchanged if the key is not found
+
+        # Node with two children: copy the inorder successor (smallest in the right subtree)
+        # and delete the successor instead, which has at most one child
+        if current.left is not None and current.right is not None:
+            parent = current
+            successor = current.right
+            while successor.left is not None:
+                parent = successor
+                successor = successor.left
+            current.key = successor.key
+            current = successor
+
+        # Node with only one child or no child: replace it with that child
+        child = current.left if current.left is not None else current.right
+        if parent is None:
+            return child
+        if parent.left is current:
+            parent.left = child
         else:
-            # Node with only one child or no child
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
-
-            # Node with two children: Get the inorder successor (smallest in the right subtree)
-            node.key = self._min_value(node.right)
-            # Delete the inorder successor
-            node.right = self._delete(node.right, node.key)
-
+            parent.right = child
         return node
 
     def delete(self, key: int) -> None:
@@ -183,32 +200,22 @@ class BinarySearchTree:
         """
         self.root = self._delete(self.root, key)
 
-    def _min_value(self, node: TreeNode) -> int:
-        """
-        Helper method to find the smallest key in a subtree.
-
-        Args:
-            node: The root node of the subtree.
-
-        Returns:
-            The smallest key in the subtree.
-        """
-        while node.left is not None:
-            node = node.left
-        return node.key
-
     def _inorder_traversal(self, node: Optional[TreeNode], result: List[int]) -> None:
         """
-        Helper method to perform an inorder traversal of the BST.
+        Helper method to perform an iterative inorder traversal of the BST.
 
         Args:
-            node: The current node being processed.
+            node: The root node of the subtree.
             result: A list to store the traversal result.
         """
-        if node:
-            self._inorder_traversal(node.left, result)  # Traverse the left subtree
+        stack: List[TreeNode] = []
+        while stack or node:
+            while node:
+                stack.append(node)  # Defer the current node
+                node = node.left  # Traverse the left subtree
+            node = stack.pop()
             result.append(node.key)  # Visit the current node
-            self._inorder_traversal(node.right, result)  # Traverse the right subtree
+            node = node.right  # Traverse the right subtree
 
     def inorder_traversal(self) -> List[int]:
         """
@@ -41,21 +41,26 @@ class Category:
     def __init__(self, name: str) -> None:
         self.name = name
         self.ledger = []
+        self._balance = 0.0
+        self._withdrawn = 0.0
 
     def deposit(self, amount: float, description: str = "") -> None:
         """Add a deposit to the ledger."""
         self.ledger.append({"amount": amount, "description": description})
+        self._balance += amount
 
     def withdraw(self, amount: float, description: str = "") -> bool:
         """Add a withdrawal to the ledger if there are enough funds."""
         if self.check_funds(amount):
             self.ledger.append({"amount": -amount, "description": description})
+            self._balance -= amount
+            self._withdrawn += amount
             return True
         return False
 
     def get_balance(self) -> float:
         """Return the current balance of the budget category."""
-        return sum(item["amount"] for item in self.ledger)
+        return self._balance
 
     def transfer(self, amount: float, category: "Category") -> bool:
         """Transfer funds to another category."""
@@ -84,38 +89,32 @@ class Category:
 def create_spend_chart(categories: list[Category]) -> str:
     """Create a bar chart showing the percentage spent by category."""
     # Calculate total withdrawals for each category
-    withdrawals = []
-    for category in categories:
-        total_withdrawn = sum(
-            item["amount"] for item in category.ledger if item["amount"] < 0
-        )
-        withdrawals.append(total_withdrawn)
+    withdrawals = [category._withdrawn for category in categories]
     total_withdrawn = sum(withdrawals)
 
     # Calculate percentages (rounded down to the nearest 10)
-    percentages = [int((w / total_withdrawn) * 100) // 10 * 10 for w in withdrawals]
+    percentages = [int(w / total_withdrawn * 100) // 10 * 10 for w in withdrawals]
 
     # Build the chart
-    chart = "Percentage spent by category\n"
+    rows = ["Percentage spent by category"]
     for i in range(100, -10, -10):
-        chart += f"{i:3}| "
-        for p in percentages:
-            chart += "o  " if p >= i else "   "
-        chart += "\n"
-    chart += "    " + "-" * (len(categories) * 3 + 1) + "\n"
+        rows.append(
+            f"{i:3}| " + "".join("o  " if p >= i else "   " for p in percentages)
+        )
+    rows.append("    " + "-" * (len(categories) * 3 + 1))
 
     # Add category names vertically
     max_name_length = max(len(category.name) for category in categories)
     for i in range(max_name_length):
-        chart += "     "
-        for category in categories:
-            if i < len(category.name):
-                chart += category.name[i] + "  "
-            else:
-                chart += "   "
-        if i < max_name_length - 1:
-            chart += "\n"
+        rows.append(
+            "     "
+            + "".join(
+                category.name[i] + "  " if i < len(category.name) else "   "
+                for category in categories
+            )
+        )
 
+    chart = "\n".join(rows)
     return chart
 
 
@@ -5,57 +5,93 @@ The R2Vector class provides basic vector operations such as addition, subtractio
 dot product, and comparison operations. The R3Vector class extends R2Vector to support 3D vectors and
 includes an additional method for computing the cross product.
 
+For bulk work, the R3VectorArray class stores many 3D vectors as three NumPy arrays (one per
+component) and computes sums, differences, dot products, cross products and norms for the whole
+batch at once. It requires `numpy` to be installed; when `numba` is also installed, dot products,
+cross products and norms run in fused, parallel JIT-compiled kernels instead.
+
 Classes:
     R2Vector: Represents a 2D vector with x and y components.
     R3Vector: Represents a 3D vector with x, y, and z components, inheriting from R2Vector.
+    R3VectorArray: Represents a batch of 3D vectors stored as NumPy component arrays.
 
 Example usage is provided in the main function.
 """
 
-from typing import Union, Type
+import math
+from dataclasses import dataclass, field
+from typing import List, Optional, Union, Type
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-class R2Vector:
-    """Represents a 2D vector with x and y components."""
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
-    def __init__(self, *, x: float, y: float) -> None:
-        """
-        Initializes a 2D vector.
 
-        Args:
-            x (float): The x-component of the vector.
-            y (float): The y-component of the vector.
-        """
-        self.x = x
-        self.y = y
+@dataclass(frozen=True, slots=True, kw_only=True)
+class R2Vector:
+    """
+    Represents an immutable 2D vector with x and y components.
+
+    Attributes:
+        x (float): The x-component of the vector.
+        y (float): The y-component of the vector.
+    """
+
+    x: float
+    y: float
+    # Squared norm, computed on first use
+    _norm2: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+
+    _FIELDS = ("x", "y")
+
+    @classmethod
+    def _raw(cls, x: float, y: float) -> "R2Vector":
+        """Creates a vector from positional components, skipping keyword parsing."""
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, "x", x)
+        object.__setattr__(obj, "y", y)
+        object.__setattr__(obj, "_norm2", None)
+        return obj
+
+    def _get_norm2(self) -> float:
+        """Returns the squared norm of the vector, caching it on the instance."""
+        if self._norm2 is None:
+            object.__setattr__(self, "_norm2", self.x * self.x + self.y * self.y)
+        return self._norm2
 
     def norm(self) -> float:
         """Returns the Euclidean norm (magnitude) of the vector."""
-        return sum(val**2 for val in vars(self).values()) ** 0.5
+        return math.sqrt(self._get_norm2())
 
     def __str__(self) -> str:
         """Returns a string representation of the vector as a tuple."""
-        return str(tuple(getattr(self, i) for i in vars(self)))
+        return str(tuple(getattr(self, i) for i in self._FIELDS))
 
     def __repr__(self) -> str:
         """Returns a detailed string representation of the vector."""
-        arg_list = [f"{key}={val}" for key, val in vars(self).items()]
+        arg_list = [f"{key}={getattr(self, key)}" for key in self._FIELDS]
         args = ", ".join(arg_list)
         return f"{self.__class__.__name__}({args})"
 
     def __add__(self, other: "R2Vector") -> "R2Vector":
         """Adds two vectors."""
-        if type(self) != type(other):
+        cls = self.__class__
+        if other.__class__ is not cls:
             return NotImplemented
-        kwargs = {i: getattr(self, i) + getattr(other, i) for i in vars(self)}
-        return self.__class__(**kwargs)
+        return cls._raw(self.x + other.x, self.y + other.y)
 
     def __sub__(self, other: "R2Vector") -> "R2Vector":
         """Subtracts one vector from another."""
-        if type(self) != type(other):
+        cls = self.__class__
+        if other.__class__ is not cls:
             return NotImplemented
-        kwargs = {i: getattr(self, i) - getattr(other, i) for i in vars(self)}
-        return self.__class__(**kwargs)
+        return cls._raw(self.x - other.x, self.y - other.y)
 
     def __mul__(self, other: Union[float, "R2Vector"]) -> Union["R2Vector", float]:
         """
@@ -67,19 +103,19 @@ class R2Vector:
         Returns:
             R2Vector or float: The result of scalar multiplication or the dot product.
         """
-        if isinstance(other, (int, float)):
-            kwargs = {i: getattr(self, i) * other for i in vars(self)}
-            return self.__class__(**kwargs)
+        # exact int/float types take the fast path, subclasses fall back to isinstance
+        other_type = type(other)
+        if other_type is float or other_type is int or isinstance(other, (int, float)):
+            return self.__class__._raw(self.x * other, self.y * other)
         elif isinstance(other, R2Vector):
-            args = [getattr(self, i) * getattr(other, i) for i in vars(self)]
-            return sum(args)
+            return self.x * other.x + self.y * other.y
         return NotImplemented
 
     def __eq__(self, other: object) -> bool:
         """Checks if two vectors are equal."""
-        if not isinstance(other, R2Vector):
+        if other.__class__ is not self.__class__:
             return NotImplemented
-        return all(getattr(self, i) == getattr(other, i) for i in vars(self))
+        return self.x == other.x and self.y == other.y
 
     def __ne__(self, other: object) -> bool:
         """Checks if two vectors are not equal."""
@@ -87,15 +123,15 @@ class R2Vector:
 
     def __lt__(self, other: "R2Vector") -> bool:
         """Checks if the norm of this vector is less than the norm of another vector."""
-        if type(self) != type(other):
+        if other.__class__ is not self.__class__:
             return NotImplemented
-        return self.norm() < other.norm()
+        return self._get_norm2() < other._get_norm2()
 
     def __gt__(self, other: "R2Vector") -> bool:
         """Checks if the norm of this vector is greater than the norm of another vector."""
-        if type(self) != type(other):
+        if other.__class__ is not self.__class__:
             return NotImplemented
-        return self.norm() > other.norm()
+        return self._get_norm2() > other._get_norm2()
 
     def __le__(self, other: "R2Vector") -> bool:
         """Checks if the norm of this vector is less than or equal to the norm of another vector."""
@@ -106,20 +142,76 @@ class R2Vector:
         return not self < other
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class R3Vector(R2Vector):
-    """Represents a 3D vector with x, y, and z components, inheriting from R2Vector."""
+    """
+    Represents an immutable 3D vector with x, y, and z components, inheriting from R2Vector.
+
+    Attributes:
+        x (float): The x-component of the vector.
+        y (float): The y-component of the vector.
+        z (float): The z-component of the vector.
+    """
+
+    z: float
+
+    _FIELDS = ("x", "y", "z")
+
+    @classmethod
+    def _raw(cls, x: float, y: float, z: float) -> "R3Vector":
+        """Creates a vector from positional components, skipping keyword parsing."""
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, "x", x)
+        object.__setattr__(obj, "y", y)
+        object.__setattr__(obj, "z", z)
+        object.__setattr__(obj, "_norm2", None)
+        return obj
+
+    def _get_norm2(self) -> float:
+        """Returns the squared norm of the vector, caching it on the instance."""
+        if self._norm2 is None:
+            object.__setattr__(
+                self, "_norm2", self.x * self.x + self.y * self.y + self.z * self.z
+            )
+        return self._norm2
+
+    def __add__(self, other: "R3Vector") -> "R3Vector":
+        """Adds two vectors."""
+        cls = self.__class__
+        if other.__class__ is not cls:
+            return NotImplemented
+        return cls._raw(self.x + other.x, self.y + other.y, self.z + other.z)
 
-    def __init__(self, *, x: float, y: float, z: float) -> None:
+    def __sub__(self, other: "R3Vector") -> "R3Vector":
+        """Subtracts one vector from another."""
+        cls = self.__class__
+        if other.__class__ is not cls:
+            return NotImplemented
+        return cls._raw(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __mul__(self, other: Union[float, "R3Vector"]) -> Union["R3Vector", float]:
         """
-        Initializes a 3D vector.
+        Multiplies the vector by a scalar or computes the dot product with another vector.
 
         Args:
-            x (float): The x-component of the vector.
-            y (float): The y-component of the vector.
-            z (float): The z-component of the vector.
+            other (float or R3Vector): A scalar or another vector.
+
+        Returns:
+            R3Vector or float: The result of scalar multiplication or the dot product.
         """
-        super().__init__(x=x, y=y)
-        self.z = z
+        # exact int/float types take the fast path, subclasses fall back to isinstance
+        other_type = type(other)
+        if other_type is float or other_type is int or isinstance(other, (int, float)):
+            return self.__class__._raw(self.x * other, self.y * other, self.z * other)
+        elif isinstance(other, R3Vector):
+            return self.x * other.x + self.y * other.y + self.z * other.z
+        return NotImplemented
+
+    def __eq__(self, other: object) -> bool:
+        """Checks if two vectors are equal."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.x == other.x and self.y == other.y and self.z == other.z
 
     def cross(self, other: "R3Vector") -> "R3Vector":
         """
@@ -133,12 +225,177 @@ class R3Vector(R2Vector):
         """
         if not isinstance(other, R3Vector):
             return NotImplemented
-        kwargs = {
-            "x": self.y * other.z - self.z * other.y,
-            "y": self.z * other.x - self.x * other.z,
-            "z": self.x * other.y - self.y * other.x,
-        }
-        return self.__class__(**kwargs)
+        cls = self.__class__
+        return cls._raw(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x,
+        )
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _dot_kernel(ax, ay, az, bx, by, bz, out):
+        for i in prange(ax.shape[0]):
+            out[i] = ax[i] * bx[i] + ay[i] * by[i] + az[i] * bz[i]
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _cross_kernel(ax, ay, az, bx, by, bz, ox, oy, oz):
+        for i in prange(ax.shape[0]):
+            ox[i] = ay[i] * bz[i] - az[i] * by[i]
+            oy[i] = az[i] * bx[i] - ax[i] * bz[i]
+            oz[i] = ax[i] * by[i] - ay[i] * bx[i]
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _norm_kernel(x, y, z, out):
+        for i in prange(x.shape[0]):
+            out[i] = math.sqrt(x[i] * x[i] + y[i] * y[i] + z[i] * z[i])
+
+
+class R3VectorArray:
+    """Represents a batch of 3D vectors stored as contiguous x, y, and z NumPy arrays."""
+
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x, y, z) -> None:
+        """
+        Initializes a batch of 3D vectors.
+
+        Args:
+            x (array-like): The x-components of the vectors.
+            y (array-like): The y-components of the vectors.
+            z (array-like): The z-components of the vectors.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If the component arrays are not one-dimensional or have different
+                lengths.
+        """
+        if np is None:
+            raise ImportError("R3VectorArray requires numpy to be installed")
+        self.x = np.ascontiguousarray(x, dtype=np.float64)
+        self.y = np.ascontiguousarray(y, dtype=np.float64)
+        self.z = np.ascontiguousarray(z, dtype=np.float64)
+        if self.x.ndim != 1:
+            raise ValueError("Component arrays must be one-dimensional")
+        if not self.x.shape == self.y.shape == self.z.shape:
+            raise ValueError("Component arrays must have the same shape")
+
+    @classmethod
+    def from_objects(cls, vectors: List[R3Vector]) -> "R3VectorArray":
+        """
+        Builds a batch from a list of R3Vector objects.
+
+        Args:
+            vectors (list of R3Vector): The vectors to store.
+
+        Returns:
+            R3VectorArray: A batch holding the same vectors.
+        """
+        return cls(
+            [v.x for v in vectors], [v.y for v in vectors], [v.z for v in vectors]
+        )
+
+    def to_objects(self) -> List[R3Vector]:
+        """Returns the batch as a list of R3Vector objects."""
+        return [
+            R3Vector(x=x, y=y, z=z)
+            for x, y, z in zip(self.x.tolist(), self.y.tolist(), self.z.tolist())
+        ]
+
+    def __len__(self) -> int:
+        """Returns the number of vectors in the batch."""
+        return len(self.x)
+
+    def __repr__(self) -> str:
+        """Returns a detailed string representation of the batch."""
+        return f"{self.__class__.__name__}(x={self.x!r}, y={self.y!r}, z={self.z!r})"
+
+    def __add__(self, other: "R3VectorArray") -> "R3VectorArray":
+        """Adds two batches element-wise."""
+        cls = self.__class__
+        if other.__class__ is not cls:
+            return NotImplemented
+        return cls(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other: "R3VectorArray") -> "R3VectorArray":
+        """Subtracts one batch from another element-wise."""
+        cls = self.__class__
+        if other.__class__ is not cls:
+            return NotImplemented
+        return cls(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def _check_operand(self, other: "R3VectorArray") -> None:
+        """Rejects operands the element-wise kernels cannot pair up one-to-one."""
+        if other.__class__ is not self.__class__:
+            raise TypeError(
+                f"Expected {self.__class__.__name__}, got {type(other).__name__}"
+            )
+        if other.x.shape != self.x.shape:
+            raise ValueError("Batches must have the same length")
+
+    def dot(self, other: "R3VectorArray"):
+        """
+        Computes the element-wise dot products with another batch.
+
+        Args:
+            other (R3VectorArray): Another batch of the same length. Batches are paired
+                element by element and are never broadcast against each other.
+
+        Returns:
+            numpy.ndarray: The dot product of each pair of vectors.
+
+        Raises:
+            TypeError: If other is not an R3VectorArray.
+            ValueError: If the batches have different lengths.
+        """
+        self._check_operand(other)
+        if njit is not None:
+            out = np.empty_like(self.x)
+            _dot_kernel(self.x, self.y, self.z, other.x, other.y, other.z, out)
+            return out
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def cross(self, other: "R3VectorArray") -> "R3VectorArray":
+        """
+        Computes the element-wise cross products with another batch.
+
+        Args:
+            other (R3VectorArray): Another batch of the same length. Batches are paired
+                element by element and are never broadcast against each other.
+
+        Returns:
+            R3VectorArray: The cross product of each pair of vectors.
+
+        Raises:
+            TypeError: If other is not an R3VectorArray.
+            ValueError: If the batches have different lengths.
+        """
+        self._check_operand(other)
+        if njit is not None:
+            ox, oy, oz = (np.empty_like(self.x) for _ in range(3))
+            _cross_kernel(self.x, self.y, self.z, other.x, other.y, other.z, ox, oy, oz)
+            return self.__class__(ox, oy, oz)
+
+        # write each product straight into its output and share one scratch buffer
+        # for the subtrahends, so NumPy allocates 4 arrays instead of 9
+        scratch = np.empty_like(self.x)
+        ox = np.multiply(self.y, other.z)
+        np.subtract(ox, np.multiply(self.z, other.y, out=scratch), out=ox)
+        oy = np.multiply(self.z, other.x)
+        np.subtract(oy, np.multiply(self.x, other.z, out=scratch), out=oy)
+        oz = np.multiply(self.x, other.y)
+        np.subtract(oz, np.multiply(self.y, other.x, out=scratch), out=oz)
+        return self.__class__(ox, oy, oz)
+
+    def norm(self):
+        """Returns the Euclidean norm (magnitude) of each vector as a NumPy array."""
+        if njit is not None:
+            out = np.empty_like(self.x)
+            _norm_kernel(self.x, self.y, self.z, out)
+            return out
+        return np.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
 
 
 def main() -> None:
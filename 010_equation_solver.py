@@ -1,6 +1,30 @@
 from abc import ABC, abstractmethod
-import re
-from typing import Dict, List, Union
+import math
+from typing import Dict, List, NamedTuple, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# (concavity, min_max) of a parabola, indexed by whether its leading coefficient is negative
+_CONCAVITY = (("upwards", "min"), ("downwards", "max"))
+
+
+class LinearAnalysis(NamedTuple):
+    """Slope and y-intercept of a line."""
+
+    slope: float
+    intercept: float
+
+
+class QuadraticAnalysis(NamedTuple):
+    """Vertex, min/max label and concavity of a parabola."""
+
+    x: float
+    y: float
+    min_max: str
+    concavity: str
 
 
 class Equation(ABC):
@@ -35,7 +59,21 @@ class Equation(ABC):
             raise TypeError("Coefficients must be of type 'int' or 'float'")
         if args[0] == 0:
             raise ValueError("Highest degree coefficient must be different from zero")
-        self.coefficients = {(len(args) - n - 1): arg for n, arg in enumerate(args)}
+        self._coefs = tuple(args)
+        # results of solve() and analyze(), computed on first use; roots are kept as a
+        # tuple so callers can't alter the cache through the list solve() returns
+        self._solution = None
+        self._analysis = None
+
+    @property
+    def coefficients(self) -> Dict[int, Union[int, float]]:
+        """
+        Returns the coefficients of the equation keyed by power of x.
+
+        Returns:
+            Dict[int, Union[int, float]]: A dictionary mapping powers of x to their coefficients.
+        """
+        return {self.degree - n: coef for n, coef in enumerate(self._coefs)}
 
     def __init_subclass__(cls) -> None:
         """
@@ -61,22 +99,22 @@ class Equation(ABC):
             str: The equation in a readable format.
         """
         terms = []
-        for n, coefficient in self.coefficients.items():
+        for n, coefficient in zip(range(self.degree, -1, -1), self._coefs):
             if not coefficient:
                 continue
-            if n == 0:
-                terms.append(f"{coefficient:+}")
-            elif n == 1:
-                terms.append(f"{coefficient:+}x")
-            else:
-                terms.append(f"{coefficient:+}x**{n}")
-        equation_string = " ".join(terms) + " = 0"
-        return re.sub(r"(?<!\d)1(?=x)", "", equation_string.strip("+"))
+            term = f"{coefficient:+}"
+            if n > 0:
+                # a coefficient of exactly 1 is implied in front of x
+                if term in ("+1", "-1"):
+                    term = term[0]
+                term += "x" if n == 1 else f"x**{n}"
+            terms.append(term)
+        return " ".join(terms).lstrip("+") + " = 0"
 
     @abstractmethod
     def solve(self) -> List[float]:
         """
-        Solves the equation.
+        Solves the equation. The result is computed once and cached on the instance.
 
         Returns:
             List[float]: A list of solutions to the equation.
@@ -84,12 +122,13 @@ class Equation(ABC):
         pass
 
     @abstractmethod
-    def analyze(self) -> Dict[str, Union[float, str]]:
+    def analyze(self) -> Tuple[Union[float, str], ...]:
         """
-        Analyzes the equation and returns key properties.
+        Analyzes the equation and returns key properties. The result is computed once and cached
+        on the instance.
 
         Returns:
-            Dict[str, Union[float, str]]: A dictionary containing analysis results.
+            Tuple[Union[float, str], ...]: A named tuple containing analysis results.
         """
         pass
 
@@ -105,19 +144,21 @@ class LinearEquation(Equation):
         Returns:
             List[float]: A list containing the solution to the equation.
         """
-        a, b = self.coefficients.values()
-        x = -b / a
-        return [x]
+        if self._solution is None:
+            a, b = self._coefs
+            self._solution = (-b / a,)
+        return list(self._solution)
 
-    def analyze(self) -> Dict[str, float]:
+    def analyze(self) -> LinearAnalysis:
         """
         Analyzes the linear equation.
 
         Returns:
-            Dict[str, float]: A dictionary containing the slope and y-intercept of the line.
+            LinearAnalysis: A named tuple containing the slope and y-intercept of the line.
         """
-        slope, intercept = self.coefficients.values()
-        return {"slope": slope, "intercept": intercept}
+        if self._analysis is None:
+            self._analysis = LinearAnalysis(*self._coefs)
+        return self._analysis
 
 
 class QuadraticEquation(Equation):
@@ -132,8 +173,8 @@ class QuadraticEquation(Equation):
             *args: Coefficients of the quadratic equation, starting from the highest degree.
         """
         super().__init__(*args)
-        a, b, c = self.coefficients.values()
-        self.delta = b**2 - 4 * a * c
+        a, b, c = self._coefs
+        self.delta = b * b - 4 * a * c
 
     def solve(self) -> List[float]:
         """
@@ -142,32 +183,35 @@ class QuadraticEquation(Equation):
         Returns:
             List[float]: A list of real roots of the equation.
         """
-        if self.delta < 0:
-            return []
-        a, b, _ = self.coefficients.values()
-        x1 = (-b + (self.delta) ** 0.5) / (2 * a)
-        x2 = (-b - (self.delta) ** 0.5) / (2 * a)
-        if self.delta == 0:
-            return [x1]
-        return [x1, x2]
-
-    def analyze(self) -> Dict[str, Union[float, str]]:
+        if self._solution is None:
+            a, b, _ = self._coefs
+            if self.delta < 0:
+                self._solution = ()
+            else:
+                sqrt_delta = math.sqrt(self.delta)
+                inv_2a = 0.5 / a
+                # keep + sqrt_delta for a double root too, so b == 0 gives +0.0, not -0.0
+                root = (-b + sqrt_delta) * inv_2a
+                if self.delta == 0:
+                    self._solution = (root,)
+                else:
+                    self._solution = (root, (-b - sqrt_delta) * inv_2a)
+        return list(self._solution)
+
+    def analyze(self) -> QuadraticAnalysis:
         """
         Analyzes the quadratic equation.
 
         Returns:
-            Dict[str, Union[float, str]]: A dictionary containing the vertex, concavity, and min/max information.
+            QuadraticAnalysis: A named tuple containing the vertex, min/max information, and concavity.
         """
-        a, b, c = self.coefficients.values()
-        x = -b / (2 * a)
-        y = a * x**2 + b * x + c
-        if a > 0:
-            concavity = "upwards"
-            min_max = "min"
-        else:
-            concavity = "downwards"
-            min_max = "max"
-        return {"x": x, "y": y, "min_max": min_max, "concavity": concavity}
+        if self._analysis is None:
+            a, b, c = self._coefs
+            x = -b / (2 * a)
+            y = a * x * x + b * x + c
+            concavity, min_max = _CONCAVITY[a < 0]
+            self._analysis = QuadraticAnalysis(x, y, min_max, concavity)
+        return self._analysis
 
 
 def solver(equation: Equation) -> str:
@@ -190,31 +234,88 @@ def solver(equation: Equation) -> str:
     output_string += f"\n\n{equation!s:^24}\n\n"
     output_string += f'{"Solutions":-^24}\n\n'
     results = equation.solve()
-    match results:
-        case []:
-            result_list = ["No real roots"]
-        case [x]:
-            result_list = [f"x = {x:+.3f}"]
-        case [x1, x2]:
-            result_list = [f"x1 = {x1:+.3f}", f"x2 = {x2:+.3f}"]
+    n_results = len(results)
+    if n_results == 0:
+        result_list = ["No real roots"]
+    elif n_results == 1:
+        result_list = [f"x = {results[0]:+.3f}"]
+    else:
+        x1, x2 = results
+        result_list = [f"x1 = {x1:+.3f}", f"x2 = {x2:+.3f}"]
     for result in result_list:
         output_string += f"{result:^24}\n"
     output_string += f'\n{"Details":-^24}\n\n'
     details = equation.analyze()
-    match details:
-        case {"slope": slope, "intercept": intercept}:
-            details_list = [
-                f"slope = {slope:>16.3f}",
-                f"y-intercept = {intercept:>10.3f}",
-            ]
-        case {"x": x, "y": y, "min_max": min_max, "concavity": concavity}:
-            coord = f"({x:.3f}, {y:.3f})"
-            details_list = [f"concavity = {concavity:>12}", f"{min_max} = {coord:>18}"]
+    if isinstance(details, LinearAnalysis):
+        slope, intercept = details
+        details_list = [
+            f"slope = {slope:>16.3f}",
+            f"y-intercept = {intercept:>10.3f}",
+        ]
+    elif isinstance(details, QuadraticAnalysis):
+        x, y, min_max, concavity = details
+        coord = f"({x:.3f}, {y:.3f})"
+        details_list = [f"concavity = {concavity:>12}", f"{min_max} = {coord:>18}"]
     for detail in details_list:
         output_string += f"{detail}\n"
     return output_string
 
 
+def solve_all(equations: List[Equation]) -> List[str]:
+    """
+    Solves and analyzes a batch of equations, returning one formatted string per equation.
+
+    When numpy is installed, the roots of all linear and quadratic equations that have not been
+    solved yet are computed together with array operations and stored in each equation's cache,
+    so formatting them with `solver` does not solve them again one by one.
+
+    Args:
+        equations (List[Equation]): Instances of subclasses of Equation.
+
+    Returns:
+        List[str]: The formatted output of `solver` for each equation, in the same order.
+
+    Raises:
+        TypeError: If any element is not an instance of Equation.
+    """
+    if np is not None:
+        linear = [
+            eq
+            for eq in equations
+            if type(eq) is LinearEquation and eq._solution is None
+        ]
+        if linear:
+            # negate in Python first so the sign of zero matches LinearEquation.solve
+            neg_b = np.array([-eq._coefs[1] for eq in linear], dtype=np.float64)
+            a = np.array([eq._coefs[0] for eq in linear], dtype=np.float64)
+            for eq, x in zip(linear, (neg_b / a).tolist()):
+                eq._solution = (x,)
+
+        quadratic = [
+            eq
+            for eq in equations
+            if type(eq) is QuadraticEquation and eq._solution is None
+        ]
+        if quadratic:
+            neg_b = np.array([-eq._coefs[1] for eq in quadratic], dtype=np.float64)
+            inv_2a = 0.5 / np.array(
+                [eq._coefs[0] for eq in quadratic], dtype=np.float64
+            )
+            delta = np.array([eq.delta for eq in quadratic], dtype=np.float64)
+            sqrt_delta = np.sqrt(np.maximum(delta, 0))
+            x1 = ((neg_b + sqrt_delta) * inv_2a).tolist()
+            x2 = ((neg_b - sqrt_delta) * inv_2a).tolist()
+            for eq, root1, root2 in zip(quadratic, x1, x2):
+                if eq.delta < 0:
+                    eq._solution = ()
+                elif eq.delta == 0:
+                    eq._solution = (root1,)
+                else:
+                    eq._solution = (root1, root2)
+
+    return [solver(equation) for equation in equations]
+
+
 def main() -> None:
     """
     Main function to demonstrate the functionality of the Equation classes and solver.